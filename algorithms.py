@@ -1,8 +1,51 @@
+import heapq
 from collections import deque
+from dataclasses import dataclass
 from process import Process
-from typing import List, Dict, Any, Tuple
+from typing import List, Any, Tuple, Callable, Optional
 
-def fcfs(processes: List[Process]) -> Tuple[List[Dict[str, Any]], List[Process]]:
+# Integer "no next event" sentinel, far above any simulated time
+_INF = 1 << 62
+
+@dataclass(slots=True)
+class Slice:
+    """
+    A contiguous stretch of the execution timeline.
+    
+    Attributes:
+        pid (Optional[int]): Process ID, or None for idle time
+        start_time (int): Time at which the slice starts
+        end_time (int): Time at which the slice ends
+    """
+    pid: Optional[int]
+    start_time: int
+    end_time: int
+    
+    @property
+    def duration(self) -> int:
+        """Length of the slice."""
+        return self.end_time - self.start_time
+
+def _emit(timeline: List[Slice], pid: Optional[int], start_time: int, end_time: int) -> None:
+    """
+    Append an execution slice to the timeline, merging it into the previous
+    slice when the same pid (or idle period) simply continues.
+    
+    Args:
+        timeline (List[Slice]): Timeline being built
+        pid (Optional[int]): Process ID, or None for idle time
+        start_time (int): Slice start time
+        end_time (int): Slice end time
+    """
+    if timeline:
+        last = timeline[-1]
+        if last.pid == pid and last.end_time == start_time:
+            last.end_time = end_time
+            return
+    
+    timeline.append(Slice(pid, start_time, end_time))
+
+def fcfs(processes: List[Process]) -> Tuple[List[Slice], List[Process]]:
     """
     First Come First Serve scheduling algorithm.
     
@@ -11,7 +54,7 @@ def fcfs(processes: List[Process]) -> Tuple[List[Dict[str, Any]], List[Process]]
         
     Returns:
         Tuple containing:
-        - List of execution timeline dictionaries
+        - List of execution timeline slices
         - List of scheduled processes with calculated metrics
     """
     # Create a copy of the processes to avoid modifying the original
@@ -27,12 +70,7 @@ def fcfs(processes: List[Process]) -> Tuple[List[Dict[str, Any]], List[Process]]
         # If there's a gap between processes, add idle time
         if current_time < process.arrival_time:
             if current_time > 0:  # Don't add idle at the beginning
-                timeline.append({
-                    'pid': None,
-                    'start_time': current_time,
-                    'end_time': process.arrival_time,
-                    'duration': process.arrival_time - current_time
-                })
+                _emit(timeline, None, current_time, process.arrival_time)
             current_time = process.arrival_time
         
         # Set process start time if it's the first time it's running
@@ -43,111 +81,104 @@ def fcfs(processes: List[Process]) -> Tuple[List[Dict[str, Any]], List[Process]]
         execution_time = process.execute()
         
         # Add to timeline
-        timeline.append({
-            'pid': process.pid,
-            'start_time': current_time,
-            'end_time': current_time + execution_time,
-            'duration': execution_time
-        })
+        _emit(timeline, process.pid, current_time, current_time + execution_time)
         
         # Update current time
         current_time += execution_time
         
-        # Set completion time
-        process.completion_time = current_time
-        
-        # Calculate metrics
-        process.turnaround_time = process.completion_time - process.arrival_time
-        process.waiting_time = process.turnaround_time - process.burst_time
-        process.response_time = process.start_time - process.arrival_time
+        # Set completion time and calculate metrics
+        process.finish(current_time)
     
     return timeline, processes
 
-def sjf_non_preemptive(processes: List[Process]) -> Tuple[List[Dict[str, Any]], List[Process]]:
+def _run_event_driven(processes: List[Process], key_fn: Callable[[Process], Any],
+                      preemptive: bool) -> Tuple[List[Slice], List[Process]]:
     """
-    Shortest Job First (Non-preemptive) scheduling algorithm.
+    Shared event-driven core for the SJF and Priority scheduling algorithms.
     
     Args:
-        processes (List[Process]): List of processes to schedule
+        processes (List[Process]): Process copies sorted by arrival time
+        key_fn (Callable): Selection key, the process with the lowest key runs next
+        preemptive (bool): Whether a newly arrived process may preempt the running one
         
     Returns:
         Tuple containing:
-        - List of execution timeline dictionaries
+        - List of execution timeline slices
         - List of scheduled processes with calculated metrics
     """
-    # Create a copy of the processes to avoid modifying the original
-    processes = [Process(p.pid, p.arrival_time, p.burst_time, p.priority) for p in processes]
-    
-    # Sort processes by arrival time
-    processes.sort(key=lambda p: p.arrival_time)
-    
     current_time = 0
     timeline = []
-    remaining_processes = processes.copy()
     completed_processes = []
     
-    while remaining_processes:
-        # Find available processes
-        available_processes = [p for p in remaining_processes if p.arrival_time <= current_time]
+    # Ready set as a min-heap of (key, arrival order, process); the arrival
+    # order index breaks ties the same way a stable min() scan would. The
+    # running process is popped and, if preempted, pushed back with a fresh
+    # key, so the heap never holds stale entries.
+    ready = []
+    i = 0
+    n = len(processes)
+    
+    while i < n or ready:
+        # Admit every process that has arrived by now
+        while i < n and processes[i].arrival_time <= current_time:
+            heapq.heappush(ready, (key_fn(processes[i]), i, processes[i]))
+            i += 1
         
-        if not available_processes:
+        if not ready:
             # No process available, move time to next process arrival
-            next_arrival = min(p.arrival_time for p in remaining_processes)
+            next_arrival = processes[i].arrival_time
             if current_time < next_arrival:
-                timeline.append({
-                    'pid': None,
-                    'start_time': current_time,
-                    'end_time': next_arrival,
-                    'duration': next_arrival - current_time
-                })
+                _emit(timeline, None, current_time, next_arrival)
             current_time = next_arrival
             continue
         
-        # Select process with shortest burst time
-        selected_process = min(available_processes, key=lambda p: p.burst_time)
+        # Select the process with the lowest key
+        _, order, selected_process = heapq.heappop(ready)
         
         # Set process start time if it's the first time it's running
         if selected_process.start_time == -1:
             selected_process.start_time = current_time
         
-        # Execute the process
-        execution_time = selected_process.execute()
+        if preemptive:
+            # Next event is the next arrival, which is always at the cursor;
+            # with no arrivals left the sentinel lets the process run to completion
+            next_event_time = processes[i].arrival_time if i < n else _INF
+            
+            # Execute until next event
+            execution_time = min(selected_process.remaining_time, next_event_time - current_time)
+        else:
+            # Non-preemptive: run to completion
+            execution_time = selected_process.remaining_time
+        
+        # Update remaining time
+        selected_process.remaining_time -= execution_time
         
         # Add to timeline
-        timeline.append({
-            'pid': selected_process.pid,
-            'start_time': current_time,
-            'end_time': current_time + execution_time,
-            'duration': execution_time
-        })
+        _emit(timeline, selected_process.pid, current_time, current_time + execution_time)
         
         # Update current time
         current_time += execution_time
         
-        # Set completion time
-        selected_process.completion_time = current_time
-        
-        # Calculate metrics
-        selected_process.turnaround_time = selected_process.completion_time - selected_process.arrival_time
-        selected_process.waiting_time = selected_process.turnaround_time - selected_process.burst_time
-        selected_process.response_time = selected_process.start_time - selected_process.arrival_time
-        
-        # Move process from remaining to completed
-        remaining_processes.remove(selected_process)
-        completed_processes.append(selected_process)
+        # Check if process completed
+        if selected_process.remaining_time == 0:
+            selected_process.finish(current_time)
+            
+            completed_processes.append(selected_process)
+        else:
+            heapq.heappush(ready, (key_fn(selected_process), order, selected_process))
     
     return timeline, completed_processes
 
-def sjf_preemptive(processes: List[Process]) -> Tuple[List[Dict[str, Any]], List[Process]]:
+def sjf_non_preemptive(processes: List[Process]) -> Tuple[List[Slice], List[Process]]:
     """
-    Shortest Job First (Preemptive) / Shortest Remaining Time First scheduling algorithm.
+    Shortest Job First (Non-preemptive) scheduling algorithm.
     
     Args:
         processes (List[Process]): List of processes to schedule
         
     Returns:
         Tuple containing:
-        - List of execution timeline dictionaries
+        - List of execution timeline slices
         - List of scheduled processes with calculated metrics
     """
     # Create a copy of the processes to avoid modifying the original
@@ -156,84 +187,31 @@ def sjf_preemptive(processes: List[Process]) -> Tuple[List[Dict[str, Any]], List
     # Sort processes by arrival time
     processes.sort(key=lambda p: p.arrival_time)
     
-    current_time = 0
-    timeline = []
-    remaining_processes = processes.copy()
-    completed_processes = []
-    
-    # Track the previously running process
-    current_process = None
+    # Select process with shortest burst time
+    return _run_event_driven(processes, lambda p: p.burst_time, preemptive=False)
+
+def sjf_preemptive(processes: List[Process]) -> Tuple[List[Slice], List[Process]]:
+    """
+    Shortest Job First (Preemptive) / Shortest Remaining Time First scheduling algorithm.
     
-    while remaining_processes:
-        # Find available processes
-        available_processes = [p for p in remaining_processes if p.arrival_time <= current_time]
-        
-        if not available_processes:
-            # No process available, move time to next process arrival
-            next_arrival = min(p.arrival_time for p in remaining_processes)
-            if current_time < next_arrival:
-                timeline.append({
-                    'pid': None,
-                    'start_time': current_time,
-                    'end_time': next_arrival,
-                    'duration': next_arrival - current_time
-                })
-            current_time = next_arrival
-            current_process = None
-            continue
-        
-        # Select process with shortest remaining time
-        selected_process = min(available_processes, key=lambda p: p.remaining_time)
-        
-        # Check if we're switching processes
-        if current_process != selected_process:
-            # Set process start time if it's the first time it's running
-            if selected_process.start_time == -1:
-                selected_process.start_time = current_time
-            current_process = selected_process
-        
-        # Find next arrival or completion event
-        next_event_time = float('inf')
-        for p in remaining_processes:
-            if p.arrival_time > current_time and p.arrival_time < next_event_time:
-                next_event_time = p.arrival_time
-        
-        # If no new arrivals before completion, process runs until completion
-        if next_event_time == float('inf'):
-            execution_time = selected_process.remaining_time
-        else:
-            # Execute until next event
-            execution_time = min(selected_process.remaining_time, next_event_time - current_time)
-        
-        # Update remaining time
-        selected_process.remaining_time -= execution_time
-        
-        # Add to timeline
-        timeline.append({
-            'pid': selected_process.pid,
-            'start_time': current_time,
-            'end_time': current_time + execution_time,
-            'duration': execution_time
-        })
-        
-        # Update current time
-        current_time += execution_time
+    Args:
+        processes (List[Process]): List of processes to schedule
         
-        # Check if process completed
-        if selected_process.remaining_time == 0:
-            selected_process.completion_time = current_time
-            selected_process.turnaround_time = selected_process.completion_time - selected_process.arrival_time
-            selected_process.waiting_time = selected_process.turnaround_time - selected_process.burst_time
-            selected_process.response_time = selected_process.start_time - selected_process.arrival_time
-            
-            # Move process from remaining to completed
-            remaining_processes.remove(selected_process)
-            completed_processes.append(selected_process)
-            current_process = None
+    Returns:
+        Tuple containing:
+        - List of execution timeline slices
+        - List of scheduled processes with calculated metrics
+    """
+    # Create a copy of the processes to avoid modifying the original
+    processes = [Process(p.pid, p.arrival_time, p.burst_time, p.priority) for p in processes]
     
-    return timeline, completed_processes
+    # Sort processes by arrival time
+    processes.sort(key=lambda p: p.arrival_time)
+    
+    # Select process with shortest remaining time
+    return _run_event_driven(processes, lambda p: p.remaining_time, preemptive=True)
 
-def priority_scheduling(processes: List[Process], preemptive=False) -> Tuple[List[Dict[str, Any]], List[Process]]:
+def priority_scheduling(processes: List[Process], preemptive=False) -> Tuple[List[Slice], List[Process]]:
     """
     Priority Scheduling algorithm (can be preemptive or non-preemptive).
     
@@ -243,7 +221,7 @@ def priority_scheduling(processes: List[Process], preemptive=False) -> Tuple[Lis
         
     Returns:
         Tuple containing:
-        - List of execution timeline dictionaries
+        - List of execution timeline slices
         - List of scheduled processes with calculated metrics
     """
     # Create a copy of the processes to avoid modifying the original
@@ -252,92 +230,10 @@ def priority_scheduling(processes: List[Process], preemptive=False) -> Tuple[Lis
     # Sort processes by arrival time
     processes.sort(key=lambda p: p.arrival_time)
     
-    current_time = 0
-    timeline = []
-    remaining_processes = processes.copy()
-    completed_processes = []
-    
-    # Track the previously running process
-    current_process = None
-    
-    while remaining_processes:
-        # Find available processes
-        available_processes = [p for p in remaining_processes if p.arrival_time <= current_time]
-        
-        if not available_processes:
-            # No process available, move time to next process arrival
-            next_arrival = min(p.arrival_time for p in remaining_processes)
-            if current_time < next_arrival:
-                timeline.append({
-                    'pid': None,
-                    'start_time': current_time,
-                    'end_time': next_arrival,
-                    'duration': next_arrival - current_time
-                })
-            current_time = next_arrival
-            current_process = None
-            continue
-        
-        # Select process with highest priority (lowest priority number)
-        selected_process = min(available_processes, key=lambda p: p.priority)
-        
-        # For non-preemptive, if a process is already running, continue with it
-        if not preemptive and current_process and current_process in available_processes:
-            selected_process = current_process
-        
-        # Check if we're switching processes
-        if current_process != selected_process:
-            # Set process start time if it's the first time it's running
-            if selected_process.start_time == -1:
-                selected_process.start_time = current_time
-            current_process = selected_process
-        
-        if preemptive:
-            # Find next arrival event
-            next_event_time = float('inf')
-            for p in remaining_processes:
-                if p.arrival_time > current_time and p.arrival_time < next_event_time:
-                    next_event_time = p.arrival_time
-            
-            # If no new arrivals before completion, process runs until completion
-            if next_event_time == float('inf'):
-                execution_time = selected_process.remaining_time
-            else:
-                # Execute until next event
-                execution_time = min(selected_process.remaining_time, next_event_time - current_time)
-        else:
-            # Non-preemptive: run to completion
-            execution_time = selected_process.remaining_time
-        
-        # Update remaining time
-        selected_process.remaining_time -= execution_time
-        
-        # Add to timeline
-        timeline.append({
-            'pid': selected_process.pid,
-            'start_time': current_time,
-            'end_time': current_time + execution_time,
-            'duration': execution_time
-        })
-        
-        # Update current time
-        current_time += execution_time
-        
-        # Check if process completed
-        if selected_process.remaining_time == 0:
-            selected_process.completion_time = current_time
-            selected_process.turnaround_time = selected_process.completion_time - selected_process.arrival_time
-            selected_process.waiting_time = selected_process.turnaround_time - selected_process.burst_time
-            selected_process.response_time = selected_process.start_time - selected_process.arrival_time
-            
-            # Move process from remaining to completed
-            remaining_processes.remove(selected_process)
-            completed_processes.append(selected_process)
-            current_process = None
-    
-    return timeline, completed_processes
+    # Select process with highest priority (lowest priority number)
+    return _run_event_driven(processes, lambda p: p.priority, preemptive=preemptive)
 
-def round_robin(processes: List[Process], time_quantum: int) -> Tuple[List[Dict[str, Any]], List[Process]]:
+def round_robin(processes: List[Process], time_quantum: int) -> Tuple[List[Slice], List[Process]]:
     """
     Round Robin scheduling algorithm.
     
@@ -347,7 +243,7 @@ def round_robin(processes: List[Process], time_quantum: int) -> Tuple[List[Dict[
         
     Returns:
         Tuple containing:
-        - List of execution timeline dictionaries
+        - List of execution timeline slices
         - List of scheduled processes with calculated metrics
     """
     # Create a copy of the processes to avoid modifying the original
@@ -359,31 +255,29 @@ def round_robin(processes: List[Process], time_quantum: int) -> Tuple[List[Dict[
     current_time = 0
     timeline = []
     
-    # Create ready queue
+    # Create ready queue; arrivals are admitted through a cursor into the
+    # arrival-sorted list
     ready_queue = deque()
-    remaining_processes = processes.copy()
     completed_processes = []
+    i = 0
+    n = len(processes)
     
     # Find first arrival time
-    if remaining_processes:
-        current_time = remaining_processes[0].arrival_time
+    if processes:
+        current_time = processes[0].arrival_time
     
-    while remaining_processes or ready_queue:
+    while i < n or ready_queue:
         # Add newly arrived processes to ready queue
-        while remaining_processes and remaining_processes[0].arrival_time <= current_time:
-            ready_queue.append(remaining_processes.pop(0))
+        while i < n and processes[i].arrival_time <= current_time:
+            ready_queue.append(processes[i])
+            i += 1
         
         if not ready_queue:
             # No process in ready queue, move time to next arrival
-            if remaining_processes:
-                next_arrival = remaining_processes[0].arrival_time
+            if i < n:
+                next_arrival = processes[i].arrival_time
                 if current_time < next_arrival:
-                    timeline.append({
-                        'pid': None,
-                        'start_time': current_time,
-                        'end_time': next_arrival,
-                        'duration': next_arrival - current_time
-                    })
+                    _emit(timeline, None, current_time, next_arrival)
                 current_time = next_arrival
             continue
         
@@ -399,28 +293,21 @@ def round_robin(processes: List[Process], time_quantum: int) -> Tuple[List[Dict[
         process.remaining_time -= execution_time
         
         # Add to timeline
-        timeline.append({
-            'pid': process.pid,
-            'start_time': current_time,
-            'end_time': current_time + execution_time,
-            'duration': execution_time
-        })
+        _emit(timeline, process.pid, current_time, current_time + execution_time)
         
         # Update current time
         current_time += execution_time
         
         # Add newly arrived processes to ready queue (again, after time has passed)
-        while remaining_processes and remaining_processes[0].arrival_time <= current_time:
-            ready_queue.append(remaining_processes.pop(0))
+        while i < n and processes[i].arrival_time <= current_time:
+            ready_queue.append(processes[i])
+            i += 1
         
         # Check if process is completed
         if process.remaining_time > 0:
             ready_queue.append(process)
         else:
-            process.completion_time = current_time
-            process.turnaround_time = process.completion_time - process.arrival_time
-            process.waiting_time = process.turnaround_time - process.burst_time
-            process.response_time = process.start_time - process.arrival_time
+            process.finish(current_time)
             completed_processes.append(process)
     
     return timeline, completed_processes
@@ -70,6 +70,10 @@ def simulate():
             
             processes.append(Process(i+1, arrival_time, burst_time, priority))
         
+        # Sort by arrival time once up front; the algorithms' own stable sorts
+        # then see already-ordered input, which Timsort handles in one pass
+        processes.sort(key=lambda p: p.arrival_time)
+        
         # Run selected algorithm
         results = {}
         comparison = None
@@ -84,21 +88,22 @@ def simulate():
                 "Round Robin"
             ]
             
+            all_results = {}
             all_metrics = {}
             for algo in algorithms:
-                algo_results = run_algorithm(algo, processes, time_quantum if algo == "Round Robin" else None)
-                all_metrics[algo] = algo_results['metrics']
+                all_results[algo] = run_algorithm(algo, processes, time_quantum if algo == "Round Robin" else None)
+                all_metrics[algo] = all_results[algo]['metrics']
             
             comparison = compare_algorithms(all_metrics)
             
-            # Also show detailed results for FCFS as a default
-            results = run_algorithm("FCFS", processes)
+            # Also show detailed results for FCFS as a default, reusing the run above
+            results = all_results["FCFS"]
             algorithm = "All Algorithms (Showing FCFS Details)"
         else:
             results = run_algorithm(algorithm, processes, time_quantum)
         
         # Generate visualizations
-        gantt_chart = generate_gantt_chart(results['timeline'], len(processes))
+        gantt_chart = generate_gantt_chart(results['timeline'])
         process_table = display_process_table(results['processes'])
         metrics_summary = display_summary_metrics(results['processes'])
         
@@ -122,23 +127,21 @@ def run_algorithm(algorithm: str, processes: List[Process], time_quantum: Option
     timeline = []
     scheduled_processes = []
     
-    # Create copies of processes to avoid modifying the original list
-    process_copies = [Process(p.pid, p.arrival_time, p.burst_time, p.priority) for p in processes]
-    
+    # Each algorithm copies the processes itself, so no copy is needed here
     if algorithm == "FCFS":
-        timeline, scheduled_processes = fcfs(process_copies)
+        timeline, scheduled_processes = fcfs(processes)
     elif algorithm == "SJF (Non-preemptive)":
-        timeline, scheduled_processes = sjf_non_preemptive(process_copies)
+        timeline, scheduled_processes = sjf_non_preemptive(processes)
     elif algorithm == "SJF (Preemptive)":
-        timeline, scheduled_processes = sjf_preemptive(process_copies)
+        timeline, scheduled_processes = sjf_preemptive(processes)
     elif algorithm == "Priority (Non-preemptive)":
-        timeline, scheduled_processes = priority_scheduling(process_copies, preemptive=False)
+        timeline, scheduled_processes = priority_scheduling(processes, preemptive=False)
     elif algorithm == "Priority (Preemptive)":
-        timeline, scheduled_processes = priority_scheduling(process_copies, preemptive=True)
+        timeline, scheduled_processes = priority_scheduling(processes, preemptive=True)
     elif algorithm == "Round Robin":
         # Default time quantum if not provided
         rr_time_quantum = 2 if time_quantum is None else time_quantum
-        timeline, scheduled_processes = round_robin(process_copies, rr_time_quantum)
+        timeline, scheduled_processes = round_robin(processes, rr_time_quantum)
     
     metrics = calculate_metrics(scheduled_processes)
     
@@ -1,3 +1,4 @@
+from string import Template
 from typing import List
 from process import Process
 
@@ -20,30 +21,32 @@ def calculate_metrics(processes: List[Process]) -> dict:
             'throughput': 0
         }
     
-    total_turnaround_time = sum(p.turnaround_time for p in processes)
-    total_waiting_time = sum(p.waiting_time for p in processes)
-    total_response_time = sum(p.response_time for p in processes)
+    # Accumulate every total and extreme in a single pass over the processes
+    total_turnaround_time = 0
+    total_waiting_time = 0
+    total_response_time = 0
+    total_burst_time = 0
+    max_completion_time = processes[0].completion_time
+    min_arrival_time = processes[0].arrival_time
+    for p in processes:
+        total_turnaround_time += p.turnaround_time
+        total_waiting_time += p.waiting_time
+        total_response_time += p.response_time
+        total_burst_time += p.burst_time
+        if p.completion_time > max_completion_time:
+            max_completion_time = p.completion_time
+        if p.arrival_time < min_arrival_time:
+            min_arrival_time = p.arrival_time
+    
+    total_time = max_completion_time - min_arrival_time
     
     # Calculate CPU utilization
-    if processes:
-        total_burst_time = sum(p.burst_time for p in processes)
-        max_completion_time = max(p.completion_time for p in processes)
-        min_arrival_time = min(p.arrival_time for p in processes)
-        total_time = max_completion_time - min_arrival_time
-        cpu_utilization = (total_burst_time / total_time) * 100 if total_time > 0 else 0
-    else:
-        cpu_utilization = 0
+    cpu_utilization = (total_burst_time / total_time) * 100 if total_time > 0 else 0
     
     # Calculate throughput
-    if processes:
-        max_completion_time = max(p.completion_time for p in processes)
-        min_arrival_time = min(p.arrival_time for p in processes)
-        total_time = max_completion_time - min_arrival_time
-        throughput = len(processes) / total_time if total_time > 0 else 0
-    else:
-        throughput = 0
-    
     n = len(processes)
+    throughput = n / total_time if total_time > 0 else 0
+    
     return {
         'avg_turnaround_time': total_turnaround_time / n,
         'avg_waiting_time': total_waiting_time / n,
@@ -52,45 +55,36 @@ def calculate_metrics(processes: List[Process]) -> dict:
         'throughput': throughput
     }
 
-def compare_algorithms(results: dict) -> str:
-    """
-    Compare the performance of different scheduling algorithms with HTML formatting.
-    
-    Args:
-        results (dict): Dictionary containing results for different algorithms
-        
-    Returns:
-        str: Comparison result as HTML formatted content
-    """
-    if not results:
-        return '<div class="alert alert-warning">No results to compare.</div>'
-    
-    # Find the best algorithm for each metric
-    metrics_to_compare = ['avg_turnaround_time', 'avg_waiting_time', 'avg_response_time', 'cpu_utilization', 'throughput']
-    best_algorithms = {}
-    
-    for metric in metrics_to_compare:
-        if metric in ['avg_turnaround_time', 'avg_waiting_time', 'avg_response_time']:
-            # Lower is better
-            best_value = float('inf')
-            best_algo = None
-            for algo, metrics in results.items():
-                if metrics[metric] < best_value:
-                    best_value = metrics[metric]
-                    best_algo = algo
-        else:
-            # Higher is better
-            best_value = float('-inf')
-            best_algo = None
-            for algo, metrics in results.items():
-                if metrics[metric] > best_value:
-                    best_value = metrics[metric]
-                    best_algo = algo
-        
-        best_algorithms[metric] = (best_algo, best_value)
-    
-    # Create HTML formatted comparison table
-    html = '''
+# Metrics shown in the comparison, in column order
+_METRICS_TO_COMPARE = ['avg_turnaround_time', 'avg_waiting_time', 'avg_response_time', 'cpu_utilization', 'throughput']
+
+# Lower is better for the time metrics, higher is better for the rest
+_METRIC_SIGNS = {
+    'avg_turnaround_time': -1,
+    'avg_waiting_time': -1,
+    'avg_response_time': -1,
+    'cpu_utilization': 1,
+    'throughput': 1
+}
+
+_METRIC_ICONS = {
+    'avg_turnaround_time': 'bi-arrow-repeat',
+    'avg_waiting_time': 'bi-hourglass-split',
+    'avg_response_time': 'bi-lightning-charge',
+    'cpu_utilization': 'bi-cpu',
+    'throughput': 'bi-speedometer'
+}
+
+_METRIC_NAMES = {
+    'avg_turnaround_time': 'Turnaround Time',
+    'avg_waiting_time': 'Waiting Time',
+    'avg_response_time': 'Response Time',
+    'cpu_utilization': 'CPU Utilization',
+    'throughput': 'Throughput'
+}
+
+# Static parts of the comparison HTML, built once at import time
+_COMPARISON_TABLE_HEADER = '''
     <div class="table-responsive">
         <table class="table table-bordered table-hover">
             <thead class="table-dark">
@@ -105,38 +99,14 @@ def compare_algorithms(results: dict) -> str:
             </thead>
             <tbody>
     '''
-    
-    # Add a row for each algorithm
-    for algo, metrics in results.items():
-        html += '<tr>'
-        html += f'<td>{algo}</td>'
-        
-        # Highlight the best value for each metric
-        for metric, display in [
-            ('avg_turnaround_time', 'Avg Turnaround Time'),
-            ('avg_waiting_time', 'Avg Waiting Time'),
-            ('avg_response_time', 'Avg Response Time'),
-            ('cpu_utilization', 'CPU Utilization (%)'),
-            ('throughput', 'Throughput')
-        ]:
-            is_best = best_algorithms[metric][0] == algo
-            value = metrics[metric]
-            
-            if is_best:
-                html += f'<td class="table-success fw-bold">{value:.2f}</td>'
-            else:
-                html += f'<td>{value:.2f}</td>'
-                
-        html += '</tr>'
-    
-    html += '''
+
+_COMPARISON_TABLE_FOOTER = '''
             </tbody>
         </table>
     </div>
     '''
-    
-    # Create a summary of best algorithms
-    html += '''
+
+_BEST_SUMMARY_HEADER = '''
     <div class="card bg-dark mt-4">
         <div class="card-header bg-primary text-white">
             <h5 class="mb-0">Best Algorithm for Each Metric</h5>
@@ -144,44 +114,79 @@ def compare_algorithms(results: dict) -> str:
         <div class="card-body">
             <div class="row">
     '''
-    
-    # Create a card for each metric's best algorithm
-    metric_icons = {
-        'avg_turnaround_time': 'bi-arrow-repeat',
-        'avg_waiting_time': 'bi-hourglass-split',
-        'avg_response_time': 'bi-lightning-charge',
-        'cpu_utilization': 'bi-cpu',
-        'throughput': 'bi-speedometer'
-    }
-    
-    metric_names = {
-        'avg_turnaround_time': 'Turnaround Time',
-        'avg_waiting_time': 'Waiting Time',
-        'avg_response_time': 'Response Time',
-        'cpu_utilization': 'CPU Utilization',
-        'throughput': 'Throughput'
-    }
-    
-    for metric in metrics_to_compare:
-        best_algo, best_value = best_algorithms[metric]
-        html += f'''
+
+_BEST_SUMMARY_FOOTER = '''
+            </div>
+        </div>
+    </div>
+    '''
+
+_ROW_TEMPLATE = Template('<tr><td>$algo</td>$cells</tr>')
+
+_CARD_TEMPLATE = Template('''
             <div class="col-md-4 mb-3">
                 <div class="card h-100 border-secondary">
                     <div class="card-header">
-                        <h6 class="mb-0"><i class="bi {metric_icons[metric]}"></i> {metric_names[metric]}</h6>
+                        <h6 class="mb-0"><i class="bi $icon"></i> $name</h6>
                     </div>
                     <div class="card-body text-center">
-                        <h5 class="card-title text-primary">{best_algo}</h5>
-                        <p class="card-text text-muted">Value: {best_value:.2f}</p>
+                        <h5 class="card-title text-primary">$algo</h5>
+                        <p class="card-text text-muted">Value: $value</p>
                     </div>
                 </div>
             </div>
-        '''
+        ''')
+
+def compare_algorithms(results: dict) -> str:
+    """
+    Compare the performance of different scheduling algorithms with HTML formatting.
     
-    html += '''
-            </div>
-        </div>
-    </div>
-    '''
+    Args:
+        results (dict): Dictionary containing results for different algorithms
+        
+    Returns:
+        str: Comparison result as HTML formatted content
+    """
+    if not results:
+        return '<div class="alert alert-warning">No results to compare.</div>'
+    
+    # Find the best algorithm for each metric
+    best_algorithms = {}
+    
+    for metric in _METRICS_TO_COMPARE:
+        sign = _METRIC_SIGNS[metric]
+        # max() keeps the first algorithm on ties, like the strict comparisons did
+        best_algo = max(results, key=lambda algo: sign * results[algo][metric])
+        best_algorithms[metric] = (best_algo, results[best_algo][metric])
+    
+    # Create HTML formatted comparison table
+    parts = [_COMPARISON_TABLE_HEADER]
+    
+    # Add a row for each algorithm
+    for algo, metrics in results.items():
+        # Highlight the best value for each metric
+        cells = ''.join([
+            f'<td class="table-success fw-bold">{metrics[metric]:.2f}</td>'
+            if best_algorithms[metric][0] == algo
+            else f'<td>{metrics[metric]:.2f}</td>'
+            for metric in _METRICS_TO_COMPARE
+        ])
+        parts.append(_ROW_TEMPLATE.substitute(algo=algo, cells=cells))
+    
+    parts.append(_COMPARISON_TABLE_FOOTER)
+    
+    # Create a summary of best algorithms, with a card for each metric
+    parts.append(_BEST_SUMMARY_HEADER)
+    
+    for metric in _METRICS_TO_COMPARE:
+        best_algo, best_value = best_algorithms[metric]
+        parts.append(_CARD_TEMPLATE.substitute(
+            icon=_METRIC_ICONS[metric],
+            name=_METRIC_NAMES[metric],
+            algo=best_algo,
+            value=f'{best_value:.2f}'
+        ))
+    
+    parts.append(_BEST_SUMMARY_FOOTER)
     
-    return html
+    return ''.join(parts)
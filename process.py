@@ -2,6 +2,11 @@ class Process:
     """
     Represents a process with attributes needed for scheduling algorithms.
     """
+    __slots__ = (
+        'pid', 'arrival_time', 'burst_time', 'priority', 'remaining_time',
+        'start_time', 'completion_time', 'waiting_time', 'turnaround_time', 'response_time'
+    )
+    
     def __init__(self, pid, arrival_time, burst_time, priority=0):
         """
         Initialize a new process.
@@ -42,15 +47,22 @@ class Process:
         Returns:
             int: Time for which the process executed
         """
-        if time_quantum is None or time_quantum >= self.remaining_time:
-            executed_time = self.remaining_time
-            self.remaining_time = 0
-        else:
-            executed_time = time_quantum
-            self.remaining_time -= time_quantum
-            
+        executed_time = self.remaining_time if time_quantum is None else min(time_quantum, self.remaining_time)
+        self.remaining_time -= executed_time
         return executed_time
 
+    def finish(self, completion_time):
+        """
+        Mark the process as completed and calculate its metrics.
+        
+        Args:
+            completion_time (int): Time at which the process finished executing
+        """
+        self.completion_time = completion_time
+        self.turnaround_time = completion_time - self.arrival_time
+        self.waiting_time = self.turnaround_time - self.burst_time
+        self.response_time = self.start_time - self.arrival_time
+
     def reset(self):
         """Reset the process state for a new scheduling simulation."""
         self.remaining_time = self.burst_time
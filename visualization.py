@@ -1,14 +1,12 @@
-from typing import List, Dict, Any
-from tabulate import tabulate
-import random
+from typing import List
+from algorithms import Slice
 
-def generate_gantt_chart(timeline: List[Dict[str, Any]], processes_count: int) -> str:
+def generate_gantt_chart(timeline: List[Slice]) -> str:
     """
-    Generate a text-based Gantt chart with colors for web display.
+    Generate a text-based Gantt chart for web display.
     
     Args:
-        timeline (List[Dict]): List of execution timelines
-        processes_count (int): Total number of processes
+        timeline (List[Slice]): List of execution timeline slices
     
     Returns:
         str: Text-based Gantt chart representation
@@ -16,81 +14,80 @@ def generate_gantt_chart(timeline: List[Dict[str, Any]], processes_count: int) -
     if not timeline:
         return "No timeline data available."
     
-    # Calculate total timeline length
-    end_time = max(segment['end_time'] for segment in timeline)
+    # Sort the timeline once; the CPU bar and the per-process rows both use it
+    timeline_by_start = sorted(timeline, key=lambda x: x.start_time)
     
-    # Create chart header
-    chart = ""
+    # Calculate total timeline length and group the process segments by pid,
+    # which keeps each pid's segments in start order
+    end_time = 0
+    segments_by_pid = {}
+    for segment in timeline_by_start:
+        if segment.end_time > end_time:
+            end_time = segment.end_time
+        if segment.pid is not None:
+            segments_by_pid.setdefault(segment.pid, []).append((segment.start_time, segment.end_time))
+    
+    # Create chart header; pieces are collected in a list and joined once
+    parts = []
     
     # Create time scale
     time_scale = " " * 3  # Indent for alignment
-    for i in range(0, end_time + 1, 1):
-        time_scale += f"{i:<3}"
-    chart += time_scale + "\n"
-    
-    # Create divider
-    chart += " " * 3 + "-" * (len(time_scale) - 3) + "\n"
-    
-    # Generate fixed colors for processes
-    process_colors = {}
-    color_list = [
-        "#4285F4", "#EA4335", "#FBBC05", "#34A853",  # Google colors
-        "#00BFFF", "#FF6347", "#32CD32", "#FF69B4", "#9370DB", "#FF8C00",
-        "#20B2AA", "#8A2BE2", "#FF00FF", "#1E90FF", "#7CFC00"
-    ]
+    time_scale += "".join([f"{i:<3}" for i in range(0, end_time + 1, 1)])
+    parts.append(time_scale + "\n")
     
-    # Assign a unique color to each process ID
-    for segment in timeline:
-        if segment['pid'] is not None and segment['pid'] not in process_colors:
-            process_colors[segment['pid']] = color_list[segment['pid'] % len(color_list)]
+    # Create divider; every tick of the time scale is 3 characters wide
+    parts.append(" " * 3 + "-" * ((end_time + 1) * 3) + "\n")
     
     # Create process execution bar
-    chart += "CPU|"
+    parts.append("CPU|")
     
     current_time = 0
-    for segment in sorted(timeline, key=lambda x: x['start_time']):
+    for segment in timeline_by_start:
         # Add idle time if there's a gap
-        if segment['start_time'] > current_time:
-            gap = segment['start_time'] - current_time
-            chart += f"{'▒' * (gap * 3)}"
+        if segment.start_time > current_time:
+            gap = segment.start_time - current_time
+            parts.append('▒' * (gap * 3))
         
         # Add process execution block
-        duration = segment['end_time'] - segment['start_time']
-        if segment['pid'] is not None:
-            process_id = f"P{segment['pid']}"
-            chart += f"{process_id * ((duration * 3) // len(process_id))}{' ' * ((duration * 3) % len(process_id))}"
+        width = segment.duration * 3
+        if segment.pid is not None:
+            # Repeat the label across the block and pad the remainder with spaces
+            process_id = f"P{segment.pid}"
+            repeats, padding = divmod(width, len(process_id))
+            parts.append(process_id * repeats + " " * padding)
         else:
-            chart += "I" * (duration * 3)
+            parts.append("I" * width)
         
-        current_time = segment['end_time']
+        current_time = segment.end_time
     
-    chart += "\n"
+    parts.append("\n")
     
-    # Create process timeline (each process gets its own line)
-    seen_pids = set()
-    for segment in sorted(timeline, key=lambda x: (x['pid'] if x['pid'] is not None else float('inf'))):
-        pid = segment['pid']
-        if pid is None or pid in seen_pids:
-            continue
-        
-        seen_pids.add(pid)
-        process_line = f"P{pid} |"
+    # Create process timeline (each process gets its own line), painting each
+    # of the process's intervals instead of testing every time unit
+    for pid in sorted(segments_by_pid):
+        parts.append(f"P{pid} |")
         
         current_time = 0
-        for t in range(end_time + 1):
-            is_active = any(
-                seg['pid'] == pid and seg['start_time'] <= t < seg['end_time'] 
-                for seg in timeline
-            )
-            
-            if is_active:
-                process_line += "███"
-            else:
-                process_line += "   "
-        
-        chart += process_line + "\n"
+        for start, end in segments_by_pid[pid]:
+            parts.append("   " * (start - current_time) + "███" * (end - start))
+            current_time = end
+        parts.append("   " * (end_time + 1 - current_time) + "\n")
     
-    return chart
+    return "".join(parts)
+
+# Static parts of the process details table, built once at import time
+_PROCESS_TABLE_HEADERS = ["Process", "Arrival Time", "Burst Time", "Priority",
+                          "Completion Time", "Turnaround Time", "Waiting Time", "Response Time"]
+
+_PROCESS_TABLE_HEADER = (
+    '<table class="table table-striped table-bordered">\n'
+    '<thead class="table-dark">\n<tr>\n'
+    + ''.join(f'<th>{header}</th>\n' for header in _PROCESS_TABLE_HEADERS)
+    + '</tr>\n</thead>\n'
+    '<tbody>\n'
+)
+
+_PROCESS_TABLE_FOOTER = '</tbody>\n</table>'
 
 def display_process_table(processes: List) -> str:
     """
@@ -102,116 +99,120 @@ def display_process_table(processes: List) -> str:
     Returns:
         str: HTML table representation of process details
     """
-    headers = ["Process", "Arrival Time", "Burst Time", "Priority", 
-              "Completion Time", "Turnaround Time", "Waiting Time", "Response Time"]
+    # One f-string per row, with special styling for the process ID column
+    rows = [
+        f'<tr>\n'
+        f'<td><span class="badge bg-primary">P{p.pid}</span></td>\n'
+        f'<td>{p.arrival_time}</td>\n'
+        f'<td>{p.burst_time}</td>\n'
+        f'<td>{p.priority}</td>\n'
+        f'<td>{p.completion_time}</td>\n'
+        f'<td>{p.turnaround_time}</td>\n'
+        f'<td>{p.waiting_time}</td>\n'
+        f'<td>{p.response_time}</td>\n'
+        f'</tr>\n'
+        for p in processes
+    ]
     
-    table_data = []
-    for p in processes:
-        table_data.append([
-            f"P{p.pid}",
-            p.arrival_time,
-            p.burst_time,
-            p.priority,
-            p.completion_time,
-            p.turnaround_time,
-            p.waiting_time,
-            p.response_time
-        ])
-    
-    # Generate HTML table instead of plain text
-    html_table = '<table class="table table-striped table-bordered">\n'
-    
-    # Add table header
-    html_table += '<thead class="table-dark">\n<tr>\n'
-    for header in headers:
-        html_table += f'<th>{header}</th>\n'
-    html_table += '</tr>\n</thead>\n'
-    
-    # Add table body
-    html_table += '<tbody>\n'
-    for row in table_data:
-        html_table += '<tr>\n'
-        for i, cell in enumerate(row):
-            # Add special styling for process ID
-            if i == 0:  # Process ID column
-                html_table += f'<td><span class="badge bg-primary">{cell}</span></td>\n'
-            # Format numeric values
-            elif i >= 4:  # Result columns (completion time onwards)
-                html_table += f'<td>{cell}</td>\n'
-            else:
-                html_table += f'<td>{cell}</td>\n'
-        html_table += '</tr>\n'
-    html_table += '</tbody>\n'
-    html_table += '</table>'
-    
-    return html_table
+    return _PROCESS_TABLE_HEADER + ''.join(rows) + _PROCESS_TABLE_FOOTER
 
-def display_summary_metrics(processes: List) -> str:
+def _render_cards(avg_turnaround_time: float, avg_waiting_time: float, avg_response_time: float) -> str:
     """
-    Calculate and display summary metrics as an HTML table.
+    Render the three average-time cards of the summary metrics.
     
     Args:
-        processes (List): List of scheduled processes
+        avg_turnaround_time (float): Average turnaround time
+        avg_waiting_time (float): Average waiting time
+        avg_response_time (float): Average response time
     
     Returns:
-        str: HTML table of summary metrics
+        str: HTML for the Turnaround, Waiting and Response Time cards
     """
-    avg_turnaround_time = sum(p.turnaround_time for p in processes) / len(processes)
-    avg_waiting_time = sum(p.waiting_time for p in processes) / len(processes)
-    avg_response_time = sum(p.response_time for p in processes) / len(processes)
-    
-    # Create HTML card with metrics
-    html = '<div class="row">'
-    
-    # Turnaround Time Card
-    html += '''
+    return f'''
     <div class="col-md-4">
         <div class="card bg-dark mb-3">
             <div class="card-header text-center text-info">
                 <h5 class="mb-0"><i class="bi bi-arrow-repeat"></i> Avg. Turnaround Time</h5>
             </div>
             <div class="card-body text-center">
-                <h2 class="display-4">{:.2f}</h2>
+                <h2 class="display-4">{avg_turnaround_time:.2f}</h2>
                 <p class="card-text">Time from submission to completion</p>
             </div>
         </div>
     </div>
-    '''.format(avg_turnaround_time)
     
-    # Waiting Time Card
-    html += '''
     <div class="col-md-4">
         <div class="card bg-dark mb-3">
             <div class="card-header text-center text-warning">
                 <h5 class="mb-0"><i class="bi bi-hourglass-split"></i> Avg. Waiting Time</h5>
             </div>
             <div class="card-body text-center">
-                <h2 class="display-4">{:.2f}</h2>
+                <h2 class="display-4">{avg_waiting_time:.2f}</h2>
                 <p class="card-text">Time spent in ready queue</p>
             </div>
         </div>
     </div>
-    '''.format(avg_waiting_time)
     
-    # Response Time Card
-    html += '''
     <div class="col-md-4">
         <div class="card bg-dark mb-3">
             <div class="card-header text-center text-success">
                 <h5 class="mb-0"><i class="bi bi-lightning-charge"></i> Avg. Response Time</h5>
             </div>
             <div class="card-body text-center">
-                <h2 class="display-4">{:.2f}</h2>
+                <h2 class="display-4">{avg_response_time:.2f}</h2>
                 <p class="card-text">Time until first CPU response</p>
             </div>
         </div>
     </div>
-    '''.format(avg_response_time)
+    '''
+
+def display_summary_metrics(processes: List) -> str:
+    """
+    Calculate and display summary metrics as an HTML table.
+    
+    Args:
+        processes (List): List of scheduled processes
+    
+    Returns:
+        str: HTML table of summary metrics
+    """
+    # Accumulate every total and the latest completion in a single pass
+    n = len(processes)
+    total_turnaround_time = 0
+    total_waiting_time = 0
+    total_response_time = 0
+    total_burst_time = 0
+    max_completion_time = 0
+    for p in processes:
+        total_turnaround_time += p.turnaround_time
+        total_waiting_time += p.waiting_time
+        total_response_time += p.response_time
+        total_burst_time += p.burst_time
+        if p.completion_time > max_completion_time:
+            max_completion_time = p.completion_time
+    
+    # Guard the averages as well, so an empty run renders zeros like calculate_metrics
+    avg_turnaround_time = total_turnaround_time / n if n else 0
+    avg_waiting_time = total_waiting_time / n if n else 0
+    avg_response_time = total_response_time / n if n else 0
+    
+    if max_completion_time > 0:
+        cpu_utilization = total_burst_time / max_completion_time * 100
+        throughput = n / max_completion_time
+    else:
+        cpu_utilization = 0
+        throughput = 0
+    
+    # Create HTML card with metrics
+    parts = ['<div class="row">']
+    
+    # Turnaround, Waiting and Response Time Cards
+    parts.append(_render_cards(avg_turnaround_time, avg_waiting_time, avg_response_time))
     
-    html += '</div>'
+    parts.append('</div>')
     
     # Additional summary table
-    html += '''
+    parts.append('''
     <table class="table table-dark table-bordered mt-3">
         <thead>
             <tr>
@@ -234,10 +235,6 @@ def display_summary_metrics(processes: List) -> str:
             </tr>
         </tbody>
     </table>
-    '''.format(
-        len(processes),
-        (sum(p.burst_time for p in processes) / max(p.completion_time for p in processes) * 100),
-        len(processes) / max(p.completion_time for p in processes) if max(p.completion_time for p in processes) > 0 else 0
-    )
+    '''.format(n, cpu_utilization, throughput))
     
-    return html
+    return ''.join(parts)